@@ -70,6 +70,10 @@ from . import scenarios
 VALID_SCENARIOS = scenarios.SCENARIO_MAP.keys()
 SCENARIO_NAMES = ', '.join(map(repr, VALID_SCENARIOS))
 
+FLATTENABLE_SCENARIOS = ('A', 'B')
+QUADTREE_SCENARIOS = ('A1', 'B', 'B1')
+LOD_SCENARIOS = ('B', 'B1')
+
 
 def main(
     scenario_name='A',
@@ -77,6 +81,10 @@ def main(
     no_of_segments = 16,
     no_of_rings = 8,
     filename = '',
+    quantize = False,
+    flatten = False,
+    quadtree = False,
+    lod = False,
 ):
     
     if scenario_name not in VALID_SCENARIOS:
@@ -106,11 +114,26 @@ def main(
             no_of_segments=no_of_segments,
             no_of_rings=no_of_rings,
             filename=filename,
+            quantize=quantize,
 
         )
 
     else:
-        run_scenario()
+
+        ## pass only the options supported by the scenario
+
+        scenario_kwargs = {}
+
+        if scenario_name in FLATTENABLE_SCENARIOS:
+            scenario_kwargs['flatten'] = flatten
+
+        if scenario_name in QUADTREE_SCENARIOS:
+            scenario_kwargs['quadtree'] = quadtree
+
+        if scenario_name in LOD_SCENARIOS:
+            scenario_kwargs['lod'] = lod
+
+        run_scenario(**scenario_kwargs)
 
 
 
@@ -127,7 +150,7 @@ if __name__ == '__main__':
 
     scenario_x_help_text = (
         f"Scenario to execute (one of {SCENARIO_NAMES})"
-        " (other arguments only used in scenario X)"
+        " (other arguments only used in scenario X, unless stated otherwise)"
     )
 
     for arg_name, default, help_text in (
@@ -146,6 +169,48 @@ if __name__ == '__main__':
             help=help_text + f" (default: {default})",
         )
 
+    add_argument(
+        '--quantize',
+        action='store_true',
+        help=(
+            "Store vertex coordinates as 16-bit integers instead of 32-bit"
+            " floats"
+        ),
+    )
+
+    flattenable_names = ', '.join(FLATTENABLE_SCENARIOS)
+
+    add_argument(
+        '--flatten',
+        action='store_true',
+        help=(
+            "Flatten spheres to reduce draw calls"
+            f" (only used in scenarios {flattenable_names})"
+        ),
+    )
+
+    quadtree_names = ', '.join(QUADTREE_SCENARIOS)
+
+    add_argument(
+        '--quadtree',
+        action='store_true',
+        help=(
+            "Group spheres in a quadtree of nodes to cull them in groups"
+            f" (only used in scenarios {quadtree_names})"
+        ),
+    )
+
+    lod_names = ', '.join(LOD_SCENARIOS)
+
+    add_argument(
+        '--lod',
+        action='store_true',
+        help=(
+            "Use fewer segments/rings for spheres farther from the camera"
+            f" (only used in scenarios {lod_names})"
+        ),
+    )
+
     parsed_args = parser.parse_args()
 
     scenario = parsed_args.scenario
@@ -167,9 +232,16 @@ if __name__ == '__main__':
             no_of_segments = parsed_args.segments * multiplier,
             no_of_rings = parsed_args.rings * multiplier,
             filename = parsed_args.filename,
+            quantize = parsed_args.quantize,
         )
 
     else:
         extra_kwargs = {}
 
-    main(scenario_name=scenario, **extra_kwargs)
+    main(
+        scenario_name=scenario,
+        flatten=parsed_args.flatten,
+        quadtree=parsed_args.quadtree,
+        lod=parsed_args.lod,
+        **extra_kwargs,
+    )
@@ -0,0 +1,403 @@
+"""Facility with function for UV sphere vertex and index arrays generation."""
+
+### standard library imports
+
+from itertools import islice
+
+from array import array
+
+
+### local imports
+from ..points2d import get_2d_circle_coordinates, yield_2d_circle_points_plus
+
+
+
+### typecodes of the arrays, chosen at import time from the typecodes whose
+### items have the sizes expected by Panda3D in the current platform (the
+### arrays are copied byte by byte into Panda3D's own arrays, so the sizes
+### must match exactly)
+
+def _get_typecode(candidate_typecodes, itemsize):
+    """Return first typecode whose array items have the given size."""
+
+    for typecode in candidate_typecodes:
+
+        if array(typecode).itemsize == itemsize:
+            return typecode
+
+    raise RuntimeError(
+        f"no array typecode among {candidate_typecodes!r}"
+        f" has items of {itemsize} bytes in this platform"
+    )
+
+# 32-bit floats (Geom.NT_float32)
+COORDINATE_TYPECODE = _get_typecode('f', 4)
+
+# 16-bit signed integers (Geom.NT_int16)
+QUANTIZED_COORDINATE_TYPECODE = _get_typecode('hi', 2)
+
+# 16-bit and 32-bit unsigned integers (Geom.NT_uint16 and Geom.NT_uint32)
+
+INDEX16_TYPECODE = _get_typecode('HI', 2)
+INDEX32_TYPECODE = _get_typecode('IL', 4)
+
+
+### largest 16-bit signed integer, used as the magnitude of the largest
+### quantized coordinate
+QUANTIZED_COORDINATE_MAX = 32767
+
+
+def get_quantization_scale(radius):
+    """Return scale to apply to sphere w/ quantized coordinates.
+
+    That is, the scale that must be applied to the node holding a sphere
+    whose coordinates were quantized into 16-bit signed integers, so that
+    the sphere has the given radius.
+    """
+    return (radius * 2) / QUANTIZED_COORDINATE_MAX
+
+
+def get_uv_sphere_arrays(
+    radius,
+    no_of_segments,
+    no_of_rings,
+    quantize=False,
+):
+    """Return arrays with vertex coordinates and face indices of UV sphere.
+
+    Returns a tuple with 03 items. The first one is an array holding the
+    x, y and z coordinates of each point as 32-bit floats, one point after
+    the other.
+
+    The second and third items are (indices, ends) pairs describing
+    the faces, the first one for the triangle fans forming the caps of the
+    sphere (bottom and top) and the second one for the triangle strips
+    forming the belts between each pair of adjacent rings. The indices are
+    stored as 16-bit unsigned integers (or 32-bit ones, if there are too
+    many points for 16-bit indices) and the ends are lists with the
+    position right after the last index of each fan/strip, just like the
+    ones kept by Panda3D's GeomTrifans and GeomTristrips.
+
+    If quantize is True, the coordinates are instead quantized into 16-bit
+    signed integers, halving the memory they use. The quantized sphere
+    spans the whole range of such integers, so the node holding it must
+    be scaled by get_quantization_scale(radius) to have the given radius.
+
+    This function performs all the math required to define the sphere
+    without touching Panda3D at all, so all arrays can be handed to
+    Panda3D in bulk afterwards (see modelgen/uvspheregeom.py).
+    """
+
+    ### check error conditions
+
+    if radius <= 0:
+        raise ValueError(f"radius must be > 0, not {radius}")
+
+    if no_of_segments < 3:
+        raise ValueError(f"no_of_segments must be >= 3, not {no_of_segments}")
+
+    if no_of_rings < 3:
+        raise ValueError(f"no_of_rings must be >= 3, not {no_of_rings}")
+
+    ### calculate number of points
+    no_of_points = 2 + (no_of_segments * no_of_rings)
+
+    ### calculate the number of indices in each fan (cap) and in each
+    ### strip (belt);
+    ###
+    ### each fan has the point at the bottom/top of the sphere, followed by
+    ### the points of the first/last ring, with the first point of the ring
+    ### repeated at the end in order to close the fan;
+    ###
+    ### each strip alternates between the points of a ring and the points
+    ### of the previous ring, with the first pair repeated at the end in
+    ### order to close the strip
+
+    no_of_indices_per_fan = no_of_segments + 2
+    no_of_indices_per_strip = (no_of_segments * 2) + 2
+
+    ### calculate the number of strips;
+    ###
+    ### as done by Panda3D when strips are added to a GeomTristrips one by
+    ### one, consecutive strips are stored connected by 02 extra indices
+    ### (the last index of a strip and the first index of the next one),
+    ### which only form degenerate triangles
+
+    no_of_strips = no_of_rings - 1
+    strip_stride = no_of_indices_per_strip + 2
+
+    ### create arrays to hold the coordinates of all points and the indices
+    ### of the vertices forming the faces (fans and strips);
+    ###
+    ### the arrays are allocated with their final size at once, so they
+    ### never need to be reallocated as they are filled, which is done by
+    ### assigning whole rings at a time to (strided) slices of the arrays;
+    ###
+    ### the arrays can then be copied into a GeomVertexData and into the
+    ### primitives in a single call each, rather than writing each point
+    ### through a GeomVertexWriter and adding each vertex to the primitives
+    ### with GeomPrimitive.addVertex() (one Python->C++ call per point/index);
+    ###
+    ### as GeomPrimitive.addVertex() would, we only use 32-bit indices when
+    ### the indices don't fit in 16 bits (0xffff is reserved by Panda3D as
+    ### the strip-cut index);
+    ###
+    ### using fans and strips rather than independent triangles means each
+    ### triangle needs about 01 index rather than 03
+
+    vertex_coordinates = array(COORDINATE_TYPECODE, [0.0]) * (no_of_points * 3)
+
+    index_typecode = (
+        INDEX16_TYPECODE if no_of_points <= 0xffff else INDEX32_TYPECODE
+    )
+
+    fan_indices = array(index_typecode, [0]) * (no_of_indices_per_fan * 2)
+
+    strip_indices = (
+        array(index_typecode, [0])
+        * ((no_of_strips * strip_stride) - 2)
+    )
+
+    ### list the ends of each fan/strip
+
+    fan_ends = [no_of_indices_per_fan, no_of_indices_per_fan * 2]
+
+    strip_ends = [
+        (strip_index * strip_stride) + no_of_indices_per_strip
+        for strip_index in range(no_of_strips)
+    ]
+
+    ### write the indices connecting each strip to the previous one, that
+    ### is, the last index of the previous strip (the index of the first
+    ### point of the ring before this strip's previous ring) and the first
+    ### index of the strip (the index of the first point of its ring);
+    ###
+    ### since such indices only depend on the number of segments, they can
+    ### all be written at once, before the loop
+
+    strip_indices[strip_stride-2::strip_stride] = array(
+
+        index_typecode,
+
+        range(
+            1,
+            1 + ((no_of_strips - 1) * no_of_segments),
+            no_of_segments,
+        ),
+
+    )
+
+    strip_indices[strip_stride-1::strip_stride] = array(
+
+        index_typecode,
+
+        range(
+            1 + (2 * no_of_segments),
+            1 + ((no_of_strips + 1) * no_of_segments),
+            no_of_segments,
+        ),
+
+    )
+
+    ### define the points forming the sphere and the respective faces,
+    ### writing them to the arrays;
+    ###
+    ### this is done in 03 sequential phases: the first ring and the bottom
+    ### cap, then the remaining rings and the belts between each of them and
+    ### the previous one, then the top cap; this way the loop over the rings
+    ### doesn't need to check which ring it is traversing
+
+    ## start by gathering data for defining the structure
+
+    # points forming a segment of the circle (vertical cross-section),
+    # excluding the first and last points (the points below and at the
+    # top of the sphere)
+    #
+    # note that these are 2d points forming a circle in the xz plane
+
+    quantity_of_points = no_of_rings + 2
+
+    segment_points_xz = (
+
+        islice(
+
+            yield_2d_circle_points_plus(
+                quantity=quantity_of_points,
+                radius=radius,
+                start_degrees=270,
+                include_last=True,
+                circle_proportion=.5,
+                center=(0, radius)
+            ),
+
+            1,
+            quantity_of_points - 1,
+
+        )
+
+    )
+
+    # coordinates of the points forming a ring of radius 1 in the xy plane;
+    #
+    # the points of each ring are obtained by scaling these by the radius
+    # of the ring, so the trigonometry is performed only once rather than
+    # once per ring
+
+    unit_ring_xs, unit_ring_ys = get_2d_circle_coordinates(
+        quantity=no_of_segments,
+        radius=1.0,
+    )
+
+    ## define function to write the coordinates of the points of a ring
+    ## and return their indices;
+    ##
+    ## each segment point defined earlier represents a point in the
+    ## horizontal ring that touches the segment; since the points are in
+    ## the xz plane and each of them also touches a horizontal ring, we can
+    ## use the x coordinate of each point to represent the radius of the
+    ## circle forming the ring in the xy plane
+
+    def write_ring(ring_index, segment_x, segment_z):
+
+        ### calculate index of first point on the ring
+
+        first_index_on_ring = (
+
+            (
+                ring_index
+                * no_of_segments
+
+            ) + 1 # offset to compensate for first point at the bottom
+                  # of the sphere (0, 0, 0)
+        )
+
+        ### write the coordinates of the points on this ring;
+        ###
+        ### every third item in the slice holding the ring's coordinates is
+        ### a x coordinate, the ones after them are y coordinates and so on
+
+        start = first_index_on_ring * 3
+        stop = start + (no_of_segments * 3)
+
+        vertex_coordinates[start:stop:3] = (
+            array(
+                COORDINATE_TYPECODE,
+                [unit_x * segment_x for unit_x in unit_ring_xs],
+            )
+        )
+
+        vertex_coordinates[start+1:stop:3] = (
+            array(
+                COORDINATE_TYPECODE,
+                [unit_y * segment_x for unit_y in unit_ring_ys],
+            )
+        )
+
+        vertex_coordinates[start+2:stop:3] = (
+            array(COORDINATE_TYPECODE, [segment_z]) * no_of_segments
+        )
+
+        ### return the indices of the points on this ring (they are
+        ### consecutive);
+        ###
+        ### note that there's no duplicated point at the seam of the ring:
+        ### the faces closing the ring reuse the index of its first point
+        ### (see how the fans and strips are closed below)
+
+        return array(
+
+            index_typecode,
+
+            range(
+                first_index_on_ring,
+                first_index_on_ring + no_of_segments,
+            ),
+
+        )
+
+    ## first phase: first ring and bottom cap
+
+    # write first point (the one at the bottom of the sphere)
+    vertex_coordinates[0:3] = array(COORDINATE_TYPECODE, (0, 0, 0))
+
+    # write first ring
+    ring_indices = write_ring(0, *next(segment_points_xz))
+
+    # write fan formed between the points on the ring and the first
+    # point, whose index is 0 (it is already in the array);
+    #
+    # the points on the ring are traversed backwards, so the
+    # triangles face outwards
+
+    fan_indices[1:no_of_indices_per_fan] = (
+        ring_indices[:1] + ring_indices[::-1]
+    )
+
+    ## second phase: remaining rings and belts
+
+    for ring_index, (segment_x, segment_z) in enumerate(segment_points_xz, 1):
+
+        ### the indices of the last ring written become the indices of the
+        ### previous ring
+        previous_ring_indices = ring_indices
+
+        ### write ring
+        ring_indices = write_ring(ring_index, segment_x, segment_z)
+
+        ### write strip formed between the points in the previous ring
+        ### and the points in this ring;
+        ###
+        ### this strip comes after the strips of the previous rings (and
+        ### the indices connecting them)
+
+        start = (ring_index - 1) * strip_stride
+        stop = start + (no_of_segments * 2)
+
+        strip_indices[start:stop:2] = ring_indices
+        strip_indices[start+1:stop:2] = previous_ring_indices
+
+        ### close strip by repeating its first pair of indices
+
+        strip_indices[stop] = ring_indices[0]
+        strip_indices[stop+1] = previous_ring_indices[0]
+
+    ## third phase: top cap
+
+    # write last point (the one at the top of the sphere)
+    vertex_coordinates[-3:] = array(COORDINATE_TYPECODE, (0, 0, radius * 2))
+
+    # write fan formed between the points on the last ring and the last
+    # point (it comes after the fan of the first ring)
+
+    fan_indices[no_of_indices_per_fan:] = (
+        array(index_typecode, [no_of_points - 1])
+        + ring_indices
+        + ring_indices[:1]
+    )
+
+    ### if requested, quantize the coordinates, so that the highest one (the z
+    ### coordinate of the top of the sphere, which is equal to its diameter)
+    ### becomes the largest 16-bit signed integer
+
+    if quantize:
+
+        quantization_factor = QUANTIZED_COORDINATE_MAX / (radius * 2)
+
+        vertex_coordinates = array(
+
+            QUANTIZED_COORDINATE_TYPECODE,
+
+            [
+                round(coordinate * quantization_factor)
+                for coordinate in vertex_coordinates
+            ],
+
+        )
+
+    ### finally, return the arrays
+
+    return (
+        vertex_coordinates,
+        (fan_indices, fan_ends),
+        (strip_indices, strip_ends),
+    )
@@ -2,8 +2,6 @@
 
 ### standard library imports
 
-from collections import deque
-
 from itertools import islice
 
 
@@ -15,11 +13,12 @@ from panda3d.egg import (
     EggData,
     EggCoordinateSystem,
     EggVertexPool,
+    EggGroup,
     EggPolygon,
 )
 
 ### local imports
-from ..points2d import yield_2d_circle_points, yield_2d_circle_points_plus
+from ..points2d import get_2d_circle_coordinates, yield_2d_circle_points_plus
 
 
 
@@ -77,27 +76,28 @@ def get_uv_sphere_egg_data(
     ### reference its vertex making method
     makeNewVertex = vpool.makeNewVertex
 
-    ### as we define the points forming the sphere, add them to the vertex
-    ### pool and also define the respective faces as polygons, adding them
-    ### to the egg data
-
-    ## start by gathering data for looping while we define the structure
+    ### define and store group to hold the polygons, referencing its
+    ### addChild method;
+    ###
+    ### this way the polygons form a single named group (which becomes a
+    ### single named node when the egg data is loaded), rather than being
+    ### loose children of the egg data itself
 
-    # indices of first and last rings
+    group = EggGroup(vpool_name)
+    add_to_egg_data(group)
 
-    first_ring_index = 0
-    last_ring_index = no_of_rings - 1
+    add_to_group = group.addChild
 
-    # index of last point
-    index_of_last_point = (
-
-      # no of points
-      (2 + (no_of_segments * no_of_rings))
-
-      # minus one
-      - 1
+    ### as we define the points forming the sphere, add them to the vertex
+    ### pool and also define the respective faces as polygons, adding them
+    ### to the group;
+    ###
+    ### this is done in 03 sequential phases: the first ring and the bottom
+    ### cap, then the remaining rings and the belts between each of them and
+    ### the previous one, then the top cap; this way the loop over the rings
+    ### doesn't need to check which ring it is traversing
 
-    )
+    ## start by gathering data for defining the structure
 
     # points forming a segment of the circle (vertical cross-section),
     # excluding the first and last points (the points below and at the
@@ -127,181 +127,158 @@ def get_uv_sphere_egg_data(
 
     )
 
-    ## create collections to assist in gathering vertices for rings
-
-    current_ring_vertices = deque((), maxlen=no_of_segments)
-    previous_ring_vertices = deque((), maxlen=no_of_segments)
-
-    ## iterate over the segment points defined earlier, each of them
-    ## representing a point in the horizontal ring that touches the
-    ## segment;
-    ##
-    ## since the points are in the xz plane and each of them also touches
-    ## a horizontal ring, we can use the x coordinate of each point to
-    ## represent the radius of the circle forming the ring in the xy plane
-
-    for ring_index, (segment_x, segment_z) in enumerate(segment_points_xz):
-
-        ### now, we'll add points and respective faces depending on which
-        ### ring we are traversing
-
-        ## if this ring is the first one...
-
-        if ring_index == first_ring_index:
-
-            ## add first point, catching a reference to it
-            first_vertex = makeNewVertex(Point3D(0, 0, 0))
-
-            ## add points on first ring as you define them, catching the
-            ## returned references in a deque;
-            ##
-            ## we define the ring as a 
-
-            current_ring_vertices.extend(
-
-                makeNewVertex(Point3D(ring_x, ring_y, segment_z))
+    # points forming a ring of radius 1 in the xy plane;
+    #
+    # the points of each ring are obtained by scaling these by the radius
+    # of the ring, so the trigonometry is performed only once rather than
+    # once per ring
 
-                for ring_x, ring_y in yield_2d_circle_points(
-                    quantity=no_of_segments,
-                    radius=segment_x,
-                )
+    unit_ring_points = tuple(
 
+        zip(
+            *get_2d_circle_coordinates(
+                quantity=no_of_segments,
+                radius=1.0,
             )
+        )
 
-            ## add tris formed between each pair of points on
-            ## the ring and the first point
+    )
 
+    ## define function to add the points of a ring to the vertex pool,
+    ## returning the references to the created vertices in a list;
+    ##
+    ## each segment point defined earlier represents a point in the
+    ## horizontal ring that touches the segment; since the points are in
+    ## the xz plane and each of them also touches a horizontal ring, we can
+    ## use the x coordinate of each point to represent the radius of the
+    ## circle forming the ring in the xy plane;
+    ##
+    ## the vertices of a ring are accessed by the index of their segment;
+    ## the neighboor of the vertex at index 0 is the last vertex of the
+    ## ring, which is precisely what Python gives us for index -1, so no
+    ## modulo operation is needed
 
-            for _ in range(no_of_segments):
+    ##
+    ## since the vertex pool copies the point given to it when making a new
+    ## vertex, a single Point3D instance is reused for all points, rather
+    ## than a new one being created for each of them
 
-                ## create and add polygon
+    point = Point3D()
+    set_point = point.set
 
-                poly = EggPolygon()
-                add_to_egg_data(poly)
+    def make_ring_vertices(segment_x, segment_z):
 
-                ## add vertices forming tri;
-                ##
-                ## deques are quick at retrieving values from its edges; take
-                ## advantage of that to grab vertices at edges to form triangle
-                ## with first point;
+        ring_vertices = []
+        append_vertex = ring_vertices.append
 
-                for vertex in (
+        for unit_x, unit_y in unit_ring_points:
 
-                    first_vertex,
+            set_point(unit_x * segment_x, unit_y * segment_x, segment_z)
+            append_vertex(makeNewVertex(point))
 
-                    # neighboor vertices in first ring
+        return ring_vertices
 
-                    current_ring_vertices[0],
-                    current_ring_vertices[-1],
+    ## first phase: first ring and bottom cap
 
-                ):
-                    poly.addVertex(vertex)
+    # add first point, catching a reference to it
+    first_vertex = makeNewVertex(Point3D(0, 0, 0))
 
-                ## rotate deque;
-                ##
-                ## this amount of rotation causes the next value to end up
-                ## at the deque's index 0 and what was at index 0 is now at
-                ## index -1;
-                current_ring_vertices.rotate(-1)
+    # add points on first ring
+    current_ring_vertices = make_ring_vertices(*next(segment_points_xz))
 
-            ## move the vertices of the current ring to deque holding vertices
-            ## for previous ring;
-            ##
-            ## since we rotate the deque by the same amount of values it holds,
-            ## its vertices are in their initial positions within the deque
-            previous_ring_vertices.extend(current_ring_vertices)
+    # add tris formed between each pair of points on the ring and the
+    # first point
 
-        ## if not the first ring...
+    for segment_index in range(no_of_segments):
 
-        else:
+        ## create and add polygon
 
-            ## add points from this ring as you define them, catching the
-            ## returned references in a deque
+        poly = EggPolygon()
+        add_to_group(poly)
 
-            current_ring_vertices.extend(
+        ## add vertices forming tri
 
-                makeNewVertex(Point3D(ring_x, ring_y, segment_z))
+        for vertex in (
 
-                for ring_x, ring_y in yield_2d_circle_points(
-                    quantity=no_of_segments,
-                    radius=segment_x,
-                )
+            first_vertex,
 
-            )
+            # neighboor vertices in first ring
 
-            ## add pair of tris formed between a pair of points in the
-            ## the previous ring and the respective pair of points in
-            ## this ring
+            current_ring_vertices[segment_index],
+            current_ring_vertices[segment_index - 1],
 
-            for _ in range(no_of_segments):
+        ):
+            poly.addVertex(vertex)
 
-                ## grab vertices
+    ## second phase: remaining rings and belts
 
-                vertex_a0 = previous_ring_vertices[-1]
-                vertex_a1 = previous_ring_vertices[0]
+    for segment_x, segment_z in segment_points_xz:
 
-                vertex_b0 = current_ring_vertices[-1]
-                vertex_b1 = current_ring_vertices[0]
+        ### the vertices of the current ring become the vertices of the
+        ### previous ring
+        previous_ring_vertices = current_ring_vertices
 
-                ## create and add polygons
+        ### add points from this ring
+        current_ring_vertices = make_ring_vertices(segment_x, segment_z)
 
-                poly_a = EggPolygon()
-                add_to_egg_data(poly_a)
+        ### add pair of tris formed between a pair of points in the
+        ### the previous ring and the respective pair of points in
+        ### this ring
 
-                poly_b = EggPolygon()
-                add_to_egg_data(poly_b)
+        for segment_index in range(no_of_segments):
 
-                ## add pair of tris, one in each polygon
+            ## grab vertices
 
-                for vertex in (vertex_a0, vertex_b1, vertex_b0):
-                    poly_a.addVertex(vertex)
+            vertex_a0 = previous_ring_vertices[segment_index - 1]
+            vertex_a1 = previous_ring_vertices[segment_index]
 
-                for vertex in (vertex_b1, vertex_a0, vertex_a1):
-                    poly_b.addVertex(vertex)
+            vertex_b0 = current_ring_vertices[segment_index - 1]
+            vertex_b1 = current_ring_vertices[segment_index]
 
-                ## rotate deques
+            ## create and add polygons
 
-                previous_ring_vertices.rotate(-1)
-                current_ring_vertices.rotate(-1)
+            poly_a = EggPolygon()
+            add_to_group(poly_a)
 
-            ## move the vertices of the current ring to deque holding vertices
-            ## for previous ring;
-            previous_ring_vertices.extend(current_ring_vertices)
+            poly_b = EggPolygon()
+            add_to_group(poly_b)
 
-            ## if we are actually on the last ring...
+            ## add pair of tris, one in each polygon
 
-            if ring_index == last_ring_index:
+            for vertex in (vertex_a0, vertex_b1, vertex_b0):
+                poly_a.addVertex(vertex)
 
-                ## add last point (the one at the top of the sphere), catching
-                ## a reference to it
-                last_vertex = makeNewVertex(Point3D(0, 0, radius * 2))
+            for vertex in (vertex_b1, vertex_a0, vertex_a1):
+                poly_b.addVertex(vertex)
 
-                ## add tris formed between each pair of points on
-                ## the last ring and the last point
+    ## third phase: top cap
 
-                for _ in range(no_of_segments):
+    # add last point (the one at the top of the sphere), catching
+    # a reference to it
+    last_vertex = makeNewVertex(Point3D(0, 0, radius * 2))
 
-                    ## create and add polygon
+    # add tris formed between each pair of points on the last ring and
+    # the last point
 
-                    poly = EggPolygon()
-                    add_to_egg_data(poly)
+    for segment_index in range(no_of_segments):
 
-                    ## add vertices forming tri
+        ## create and add polygon
 
-                    for vertex in (
+        poly = EggPolygon()
+        add_to_group(poly)
 
-                        last_vertex,
-                        previous_ring_vertices[-1],
-                        previous_ring_vertices[0],
+        ## add vertices forming tri
 
-                    ):
-                        poly.addVertex(vertex)
+        for vertex in (
 
-                    ## rotate deque
-                    previous_ring_vertices.rotate(-1)
+            last_vertex,
+            current_ring_vertices[segment_index - 1],
+            current_ring_vertices[segment_index],
 
+        ):
+            poly.addVertex(vertex)
 
-    ### we don't need the vertices's references stored in these deques anymore
+    ### we don't need the vertices's references stored in these lists anymore
 
     previous_ring_vertices.clear()
     current_ring_vertices.clear()
@@ -1,28 +1,41 @@
 """Facility with function for UV sphere Geom generation."""
 
-### standard library imports
-
-from collections import deque
-
-from itertools import islice
-
-
 ### third-party imports
 
 from panda3d.core import (
 
     Geom,
+    GeomVertexArrayFormat,
     GeomVertexFormat,
     GeomVertexData,
-    GeomVertexWriter,
-    GeomTriangles,
+    GeomTrifans,
+    GeomTristrips,
+    InternalName,
+    PTA_int,
 
 )
 
 
-### local imports
-from ..points2d import yield_2d_circle_points, yield_2d_circle_points_plus
+### local import
+from .uvspherearrays import get_uv_sphere_arrays
+
+
+
+### vertex format for quantized coordinates: 03 16-bit signed integers per
+### vertex, aligned to 2 bytes so that each vertex takes only 6 bytes
+
+_quantized_array_format = GeomVertexArrayFormat()
+
+_quantized_array_format.addColumn(
+    InternalName.getVertex(),
+    3,
+    Geom.NT_int16,
+    Geom.C_point,
+    0,
+    2,
+)
 
+QUANTIZED_V3_FORMAT = GeomVertexFormat.registerFormat(_quantized_array_format)
 
 
 def get_uv_sphere_geom(
@@ -30,6 +43,7 @@ def get_uv_sphere_geom(
     no_of_segments,
     no_of_rings,
     vdata_name,
+    quantize=False,
 ):
     """Return Geom representing UV sphere.
 
@@ -42,250 +56,82 @@ def get_uv_sphere_geom(
     node = GeomNode('node_name')
     node.addGeom(generated_geom)
     base.render.attach_new_node(node)
-    """
-
-    ### check error conditions
-
-    if radius <= 0:
-        raise ValueError(f"radius must be > 0, not {radius}")
 
-    if no_of_segments < 3:
-        raise ValueError(f"no_of_segments must be >= 3, not {no_of_segments}")
+    If the same sphere must appear several times, call this function only
+    once and add the returned Geom to as many GeomNode instances as needed.
+    All of them then share the same vertex data and primitives (in RAM
+    and in the graphics card), rather than each one holding a copy of
+    the whole sphere, as would happen if this function were called once
+    per GeomNode (see scenario B).
+
+    If quantize is True, the vertex coordinates are stored as 16-bit
+    signed integers instead of 32-bit floats, halving the memory they use.
+    In such case, the node holding the Geom must be scaled by the value
+    returned by modelgen.uvspherearrays.get_quantization_scale(radius),
+    like this:
+
+    node_path = base.render.attach_new_node(node)
+    node_path.setScale(get_quantization_scale(radius))
+    """
 
-    if no_of_rings < 3:
-        raise ValueError(f"no_of_rings must be >= 3, not {no_of_rings}")
+    ### generate the coordinates of the points and the indices of the
+    ### vertices forming the faces (fans and strips), along with the ends
+    ### of each fan/strip
+
+    (
+        vertex_coordinates,
+        (fan_indices, fan_ends),
+        (strip_indices, strip_ends),
+    ) = get_uv_sphere_arrays(
+        radius=radius,
+        no_of_segments=no_of_segments,
+        no_of_rings=no_of_rings,
+        quantize=quantize,
+    )
 
     ### create vertex data
 
     vdata = GeomVertexData(
         vdata_name,
-        GeomVertexFormat.getV3(),
+        QUANTIZED_V3_FORMAT if quantize else GeomVertexFormat.getV3(),
         Geom.UHStatic,
     )
 
-    # we'll need this not only for the next call, but later as well
-    no_of_points = 2 + (no_of_segments * no_of_rings)
-
-    vdata.uncleanSetNumRows(no_of_points)
-
-    ### create writer to add points, referencing the method to add them
-    add_point = GeomVertexWriter(vdata, 'vertex').addData3
-
-    ### create primitive to hold faces (triangles), referencing the method
-    ### to add the indices of the vertices forming the triangles
-
-    triangle_primitives_holder = GeomTriangles(Geom.UHStatic)
-    add_tri_points_indices = triangle_primitives_holder.addVertices
-
-    ### as we define the points forming the sphere, add them to the vertex
-    ### data table and the respective faces to the primitive holder instance
+    vdata.uncleanSetNumRows(len(vertex_coordinates) // 3)
 
-    ## start by gathering data for looping while we define the structure
+    ### copy the coordinates of all points into the vertex data at once
+    vdata.modifyArrayHandle(0).copyDataFrom(vertex_coordinates)
 
-    # indices of first and last rings
-
-    first_ring_index = 0
-    last_ring_index = no_of_rings - 1
-
-    # index of last point
-    index_of_last_point = no_of_points - 1
-
-    # points forming a segment of the circle (vertical cross-section),
-    # excluding the first and last points (the points below and at the
-    # top of the sphere)
-    #
-    # note that these are 2d points forming a circle in the xz plane
-
-    quantity_of_points = no_of_rings + 2
-
-    segment_points_xz = (
-
-        islice(
-
-            yield_2d_circle_points_plus(
-                quantity=quantity_of_points,
-                radius=radius,
-                start_degrees=270,
-                include_last=True,
-                circle_proportion=.5,
-                center=(0, radius)
-            ),
-
-            1,
-            quantity_of_points - 1,
-
-        )
+    ### create primitives to hold faces, that is, the fans forming the
+    ### caps of the sphere and the strips forming the belts between the rings,
+    ### copying the indices of the vertices forming them at once and setting
+    ### the ends of each fan/strip
 
+    index_type = (
+        Geom.NT_uint16 if fan_indices.itemsize == 2 else Geom.NT_uint32
     )
 
-    ## create collections to assist in gathering points for rings
-
-    current_ring_indices = deque((), maxlen=no_of_segments)
-    previous_ring_indices = deque((), maxlen=no_of_segments)
-
-    ## iterate over the segment points defined earlier, each of them
-    ## representing a point in the horizontal ring that touches the
-    ## segment;
-    ##
-    ## since the points are in the xz plane and each of them also touches
-    ## a horizontal ring, we can use the x coordinate of each point to
-    ## represent the radius of the circle forming the ring in the xy plane
-
-    for ring_index, (segment_x, segment_z) in enumerate(segment_points_xz):
-
-        ### now, we'll add points and respective faces depending on which
-        ### ring we are traversing
-
-        ## if this ring is the first one...
-
-        if ring_index == first_ring_index:
-
-            ## add first point
-            add_point((0, 0, 0))
-
-            ## add points on first ring as you define them;
-            ##
-            ## we define the ring as a 
-
-            for ring_x, ring_y in yield_2d_circle_points(
-                quantity=no_of_segments,
-                radius=segment_x,
-            ):
-                add_point((ring_x, ring_y, segment_z))
-
-            ## add tris formed between each pair of points on
-            ## the ring and the first point
-
-            current_ring_indices.extend(range(1, no_of_segments + 1))
+    primitives = []
 
-            for _ in range(no_of_segments):
+    for primitive_class, indices, ends in (
+        (GeomTrifans, fan_indices, fan_ends),
+        (GeomTristrips, strip_indices, strip_ends),
+    ):
 
-                ## add indices of vertices forming tri;
-                ##
-                ## deques are quick at retrieving values from its edges; take
-                ## advantage of that to grab indices at edges to form triangle
-                ## with first point (index 0 in vertex data collection);
+        primitive = primitive_class(Geom.UHStatic)
+        primitive.setIndexType(index_type)
 
-                add_tri_points_indices(
+        primitive.modifyVertices().modifyHandle().copyDataFrom(indices)
+        primitive.setEnds(PTA_int(ends))
 
-                    # index of first point
-                    0,
-
-                    # indices of neighboor points in first ring
-
-                    current_ring_indices[0],
-                    current_ring_indices[-1],
-
-                )
-
-                ## rotate deque;
-                ##
-                ## this amount of rotation causes the next value to end up
-                ## at the deque's index 0 and what was at index 0 is now at
-                ## index -1;
-                current_ring_indices.rotate(-1)
-
-            ## move the indices of the current ring to deque holding indices
-            ## for previous ring;
-            ##
-            ## since we rotate the deque by the same amount of values it holds,
-            ## its indices are in their initial positions within the deque
-            previous_ring_indices.extend(current_ring_indices)
-
-        ## if not the first ring...
-
-        else:
-
-            ## add points from this ring as you define them
-
-            for ring_x, ring_y in yield_2d_circle_points(
-                quantity=no_of_segments,
-                radius=segment_x,
-            ):
-                add_point((ring_x, ring_y, segment_z))
-
-            ## add pair of tris formed between a pair of points in the
-            ## the previous ring and the respective pair of points in
-            ## this ring
-
-            first_index_on_ring = (
-
-                (
-                    ring_index
-                    * no_of_segments
-
-                ) + 1 # offset to compensate for first point at the bottom
-                      # of the sphere (0, 0, 0)
-            )
-
-            current_ring_indices.extend(
-
-                range(
-                    first_index_on_ring,
-                    first_index_on_ring + no_of_segments,
-                )
-
-            )
-
-            for _ in range(no_of_segments):
-
-                ## grab vertices indices
-
-                index_a0 = previous_ring_indices[-1]
-                index_a1 = previous_ring_indices[0]
-
-                index_b0 = current_ring_indices[-1]
-                index_b1 = current_ring_indices[0]
-
-                ## add pair of tris
-
-                add_tri_points_indices(index_a0, index_b1, index_b0)
-                add_tri_points_indices(index_b1, index_a0, index_a1)
-
-                ## rotate deques
-
-                previous_ring_indices.rotate(-1)
-                current_ring_indices.rotate(-1)
-
-            ## move the indices of the current ring to deque holding indices
-            ## for previous ring;
-            previous_ring_indices.extend(current_ring_indices)
-
-            ## if we are actually on the last ring...
-
-            if ring_index == last_ring_index:
-
-                ## add last point (the one at the top of the sphere)
-                add_point((0, 0, radius * 2))
-
-                ## add tris formed between each pair of points on
-                ## the last ring and the last point
-
-                for _ in range(no_of_segments):
-
-                    ## add tri
-
-                    add_tri_points_indices(
-
-                        index_of_last_point,
-                        previous_ring_indices[-1],
-                        previous_ring_indices[0],
-
-                    )
-
-                    ## rotate deque
-                    previous_ring_indices.rotate(-1)
-
-
-    ### we don't need the indices stored in these deques anymore
-
-    previous_ring_indices.clear()
-    current_ring_indices.clear()
+        primitives.append(primitive)
 
     ### finally, instantiate and return the geom after adding
-    ### the primitives holder
+    ### the primitives
 
     geom = Geom(vdata)
-    geom.addPrimitive(triangle_primitives_holder)
+
+    for primitive in primitives:
+        geom.addPrimitive(primitive)
 
     return geom
@@ -0,0 +1,80 @@
+"""Facility with function for removing duplicated vertices from arrays.
+
+The arrays generated in modelgen/uvspherearrays.py never have duplicated
+vertices (the poles are single points and the seam of each ring reuses the
+ring's first point), so they don't need this. The function here is meant
+for vertex coordinates and indices coming from other sources, like
+triangle soups where each triangle has its own copy of each of its
+vertices.
+"""
+
+### standard library import
+from array import array
+
+
+
+def get_deduplicated_arrays(vertex_coordinates, indices):
+    """Return copies of the arrays without duplicated vertices.
+
+    vertex_coordinates is a sequence with the x, y and z coordinates of
+    each vertex, one vertex after the other, and indices is a sequence
+    with indices of such vertices (like the ones in the arrays returned by
+    modelgen.uvspherearrays.get_uv_sphere_arrays()).
+
+    Vertices with exactly the same coordinates are merged into the first
+    one of them, and the indices are remapped accordingly. Both arrays are
+    returned as new arrays with the same typecodes as the given ones (or
+    'f' and 'I', when the given sequences aren't arrays). The order of the
+    unique vertices is preserved.
+    """
+
+    ### check error conditions
+
+    if len(vertex_coordinates) % 3:
+
+        raise ValueError(
+            "the number of vertex coordinates must be a multiple of 3,"
+            f" not {len(vertex_coordinates)}"
+        )
+
+    ### map the coordinates of each unique vertex to its new index, while
+    ### listing the new index of each of the original vertices
+
+    new_index_map = {}
+    set_new_index = new_index_map.setdefault
+
+    new_indices = [
+
+        set_new_index(coordinates, len(new_index_map))
+
+        for coordinates in zip(
+
+            # x, y and z coordinates of each vertex
+            vertex_coordinates[0::3],
+            vertex_coordinates[1::3],
+            vertex_coordinates[2::3],
+
+        )
+
+    ]
+
+    ### create arrays with the coordinates of the unique vertices (the keys
+    ### of the map are in the order they were inserted) and with the
+    ### remapped indices
+
+    unique_vertex_coordinates = array(
+        getattr(vertex_coordinates, 'typecode', 'f'),
+        [
+            coordinate
+            for coordinates in new_index_map
+            for coordinate in coordinates
+        ],
+    )
+
+    remapped_indices = array(
+        getattr(indices, 'typecode', 'I'),
+        [new_indices[index] for index in indices],
+    )
+
+    ### finally, return the arrays
+    return unique_vertex_coordinates, remapped_indices
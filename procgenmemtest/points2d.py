@@ -5,28 +5,36 @@ from math import tau, sin, cos
 
 
 
-def yield_2d_circle_points(quantity, radius, center=(0, 0)):
-    """Yield points of a 2D circle."""
+def get_2d_circle_coordinates(quantity, radius, center=(0, 0)):
+    """Return lists with x and y coordinates of points of a 2D circle.
+
+    All angles are computed in a single pass before the coordinates, which
+    are gathered with list comprehensions instead of being yielded one
+    point at a time.
+    """
 
     ### assign variables to each coordinate of the center point
     xc, yc = center
 
-    for point_index in range(quantity):
+    ### calculate the angles of all points;
+    ###
+    ### the step is the constant that gives us the angle of each point based
+    ### on the percentage of the circumference where such point is found
 
-        angle_radians = (
+    angle_step = tau / quantity
+    angles = [point_index * angle_step for point_index in range(quantity)]
 
-            # percentage of circumference where to find point
-            (point_index / quantity)
+    ### calculate and return coordinates
 
-            # constant to give us angle based on percentage above
-            * tau
+    return (
+        [radius * cos(angle_radians) + xc for angle_radians in angles],
+        [radius * sin(angle_radians) + yc for angle_radians in angles],
+    )
 
-        )
 
-        x = radius * cos(angle_radians)
-        y = radius * sin(angle_radians)
-
-        yield (x + xc, y + yc)
+def yield_2d_circle_points(quantity, radius, center=(0, 0)):
+    """Yield points of a 2D circle."""
+    yield from zip(*get_2d_circle_coordinates(quantity, radius, center))
 
 
 def yield_2d_circle_points_plus(
@@ -68,8 +76,8 @@ def yield_2d_circle_points_plus(
 
         ) + start_angle
 
-        if angle_radians > tau:
-            angle_radians -= tau
+        ## no need to wrap the angle back into the [0, tau] range, since
+        ## cos() and sin() are periodic and accept angles of any magnitude
 
         x = radius * cos(angle_radians)
         y = radius * sin(angle_radians)
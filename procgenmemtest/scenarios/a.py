@@ -1,31 +1,40 @@
 """Facility to run scenario A.
 
 In this scenario, an Egg file representing a UV sphere is loaded and
-instantiated multiple times.
+instantiated multiple times (the Egg file is actually loaded from an
+equivalent Bam file written the first time it is needed).
 """
 
 ### standard library import
-from itertools import cycle
+from os import environ
 
 
 ### third-party imports
 
 from direct.showbase.ShowBase import ShowBase
 
-from direct.task import Task
-
 from direct.gui.OnscreenText import OnscreenText
 
 from panda3d.core import ModelPool
 
 
 ### local imports
-from ..points2d import yield_2d_circle_points
+
+from ..points2d import get_2d_circle_coordinates
+
+from .camerapath import get_camera_path_arrays, make_spin_camera_task
+
+from ..uvspheremodel import get_uv_sphere_model_filename
 
 
 
-def run_scenario():
-    """Load Egg file multiple times."""
+def run_scenario(flatten=False):
+    """Load Egg file multiple times.
+
+    If flatten is True, the spheres are flattened into as few Geoms as
+    possible after being loaded, in order to reduce the number of draw
+    calls.
+    """
 
     ### define number of spheres to be instantiated in total
     NO_OF_SPHERES = 250
@@ -39,7 +48,10 @@ def run_scenario():
     ### display text describing scenario
 
     OnscreenText(
-        text="Scenario A: egg file loaded multiple times",
+        text=(
+            "Scenario A: egg file loaded multiple times"
+            + (" (flattened)" if flatten else "")
+        ),
         pos=(0, .02),
         fg=(1.,1.,1.,1.),
         shadow=(0.,0.,0.,1.),
@@ -49,31 +61,53 @@ def run_scenario():
     ### create group wherein to attach sphere in the scene graph
     sphere_group = base.render.attachNewNode('sphere_group')
 
+    ### set color and render mode once in the group, so they are inherited
+    ### by all spheres instead of being set on each of them
+
+    sphere_group.setColor(0., 0., 1., 1.)
+    sphere_group.set_render_mode_filled_wireframe((1.,1.,1.,1.))
+
     ### load sphere model NO_OF_SPHERES times (after the first, the subsequent
-    ### instances should all use the same geometry from the model pool)
+    ### instances should all use the same geometry from the model pool);
+    ###
+    ### the model is loaded from the Bam file equivalent to uv_sphere.egg,
+    ### which is written the first time it is needed
 
+    model_filename = get_uv_sphere_model_filename(base.loader)
 
     cam_xy_move_radius = NO_OF_SPHERES * 3
 
+    ## calculate the coordinates of the points forming a 2D circle in the xy
+    ## plane, all at once, where the spheres will be placed
+
+    sphere_xs, sphere_ys = get_2d_circle_coordinates(
+        quantity=NO_OF_SPHERES,
+        radius=cam_xy_move_radius,
+    )
+
     ## iterate over points forming a 2D sphere in the xy plane, placing a
     ## sphere in each point
 
     z = .1
 
-    for (x, y) in yield_2d_circle_points(
-
-        quantity=NO_OF_SPHERES,
-        radius=cam_xy_move_radius,
-
-    ):
+    for x, y in zip(sphere_xs, sphere_ys):
 
-        uv_sphere_np = base.loader.loadModel('uv_sphere.egg')
+        uv_sphere_np = base.loader.loadModel(model_filename)
         uv_sphere_np.reparentTo(sphere_group)
 
         uv_sphere_np.setPos(x, y, z)
-        uv_sphere_np.setColor(0., 0., 1., 1.)
-        uv_sphere_np.set_render_mode_filled_wireframe((1.,1.,1.,1.))
 
+    ### if requested, flatten the spheres so they are merged into as few
+    ### Geoms as possible, which reduces the number of draw calls;
+    ###
+    ### this is opt-in because the merged Geoms are copies of the geometry
+    ### (each with its positions baked into the vertices), which changes
+    ### what is being measured in this scenario
+
+    if flatten:
+
+        sphere_group.clearModelNodes()
+        sphere_group.flattenStrong()
 
     ### from this point on we assume the sphere's radius is 5, in our
     ### calculations, which is the value used when generating the geometry,
@@ -82,55 +116,32 @@ def run_scenario():
 
     ### define and schedule procedure to move the camera
 
-    ## preparation
-
-    # function to cycle through 2D points representing circle in xy plane
-
-    next_xy = cycle(
-        yield_2d_circle_points(cam_xy_move_radius*20, cam_xy_move_radius + 20)
-    ).__next__
-
-    # function to cycle through points forming a vertical line segment going
-    # up and down on the z axis;
+    spinCameraTask = make_spin_camera_task(
 
-    lowest = -SPHERE_RADIUS * 1
-    highest = SPHERE_RADIUS * 2
-    factor = 100
-    speed = SPHERE_RADIUS * 2
+        base.camera,
 
-    next_z = cycle(
+        *get_camera_path_arrays(
+            xy_quantity=cam_xy_move_radius*20,
+            xy_radius=cam_xy_move_radius + 20,
+            lowest=-SPHERE_RADIUS * 1,
+            highest=SPHERE_RADIUS * 2,
+            speed=SPHERE_RADIUS * 2,
+        ),
 
-        # up
+        look_at_z=SPHERE_RADIUS,
 
-        tuple(
-            i/factor
-            for i in range(lowest*factor, highest*factor, speed)
-        )
-
-        # down
-
-        + tuple(
-            i/factor
-            for i in range(highest*factor, lowest*factor, -speed)
-        )
-
-    ).__next__
-
-
-    ## defining procedure
-
-    def spinCameraTask(task):
+    )
 
-        base.camera.setPos(*next_xy(), next_z())
-        base.camera.look_at(0, 0, SPHERE_RADIUS)
+    ## if requested via the PROCGENMEMTEST_DEBUG environment variable,
+    ## print debug info (listing the whole model pool writes a lot to
+    ## stdout, which can stall the startup when measuring the scenario)
 
-        return Task.cont
+    if environ.get('PROCGENMEMTEST_DEBUG'):
 
-    ##
-    print()
-    print('Children in sphere_group:', sphere_group.getNumChildren())
-    print()
-    ModelPool.list_contents()
+        print()
+        print('Children in sphere_group:', sphere_group.getNumChildren())
+        print()
+        ModelPool.list_contents()
 
     ## scheduling
     base.taskMgr.add(spinCameraTask, "SpinCameraTask")
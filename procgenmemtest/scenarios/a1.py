@@ -1,31 +1,45 @@
 """Facility to run scenario A1.
 
 In this scenario, an Egg file representing a UV sphere is loaded once
-and replicated multiple times via instancing.
+and replicated multiple times via instancing (the Egg file is actually
+loaded from an equivalent Bam file written the first time it is needed).
 """
 
-### standard library import
-from itertools import cycle
+### standard library imports
+
+from os import environ
+
+from itertools import repeat
 
 
 ### third-party imports
 
 from direct.showbase.ShowBase import ShowBase
 
-from direct.task import Task
-
 from direct.gui.OnscreenText import OnscreenText
 
 from panda3d.core import ModelPool
 
 
 ### local imports
-from ..points2d import yield_2d_circle_points
+
+from ..points2d import get_2d_circle_coordinates
+
+from .camerapath import get_camera_path_arrays, make_spin_camera_task
+
+from .quadtree import get_quadtree_parents
+
+from ..uvspheremodel import get_uv_sphere_model_filename
 
 
 
-def run_scenario():
-    """Load Egg file once, replicate via instancing."""
+def run_scenario(quadtree=False):
+    """Load Egg file once, replicate via instancing.
+
+    If quadtree is True, the spheres are grouped in a quadtree of nodes
+    (see scenarios/quadtree.py) rather than being attached directly to a
+    single node, so that groups of spheres out of view are culled at once.
+    """
 
     ### define number of spheres to be instantiated in total
     NO_OF_SPHERES = 250
@@ -39,7 +53,10 @@ def run_scenario():
     ### display text describing scenario
 
     OnscreenText(
-        text="Scenario A1: single Egg file replicated via instancing",
+        text=(
+            "Scenario A1: single Egg file replicated via instancing"
+            + (" (quadtree)" if quadtree else "")
+        ),
         pos=(0, .02),
         fg=(1.,1.,1.,1.),
         shadow=(0.,0.,0.,1.),
@@ -49,9 +66,24 @@ def run_scenario():
     ### create group wherein to attach sphere in the scene graph
     sphere_group = base.render.attachNewNode('sphere_group')
 
-    ### load and set render mode to sphere model
+    ### load and set render mode to sphere model (the model is loaded from
+    ### the Bam file equivalent to uv_sphere.egg, which is written the first
+    ### time it is needed)
+
+    model_np = base.loader.loadModel(
+        get_uv_sphere_model_filename(base.loader)
+    )
+
+    ### flatten the model, so that each instancing replica has as few nodes
+    ### as possible under it to be traversed; the model nodes are cleared
+    ### first, so they don't prevent the flattening;
+    ###
+    ### this is done before setting the color and render mode, because
+    ### flattening would otherwise bake the color into the vertices, adding
+    ### a color column to the vertex data
 
-    model_np = base.loader.loadModel('uv_sphere.egg')
+    model_np.clearModelNodes()
+    model_np.flattenStrong()
 
     model_np.setColor(0., 0., 1., 1.)
     model_np.set_render_mode_filled_wireframe((1.,1.,1.,1.))
@@ -61,22 +93,38 @@ def run_scenario():
 
     cam_xy_move_radius = NO_OF_SPHERES * 3
 
+    ## calculate the coordinates of the points forming a 2D circle in the xy
+    ## plane, all at once, where the spheres will be placed
+
+    sphere_xs, sphere_ys = get_2d_circle_coordinates(
+        quantity=NO_OF_SPHERES,
+        radius=cam_xy_move_radius,
+    )
+
     z = .1
 
-    for sphere_index, (x, y) in enumerate(
+    # nodes to which each sphere is attached: the sphere group itself or,
+    # if requested, the innermost quadrants of a quadtree built within it
 
-        yield_2d_circle_points(
-            quantity=NO_OF_SPHERES,
-            radius=cam_xy_move_radius,
-        )
+    sphere_parents = (
+        get_quadtree_parents(sphere_group, sphere_xs, sphere_ys)
+        if quadtree
+        else repeat(sphere_group)
+    )
+
+    # names of the nodes, produced by mapping the bound format method of a
+    # single template string over the sphere indices
 
+    node_names = map('instancing_replica_{:>03}'.format, range(NO_OF_SPHERES))
+
+    for node_name, x, y, parent_np in zip(
+        node_names,
+        sphere_xs,
+        sphere_ys,
+        sphere_parents,
     ):
 
-        uv_sphere_np = (
-            sphere_group.attachNewNode(
-                f'instancing_replica_{sphere_index:>03}'
-            )
-        )
+        uv_sphere_np = parent_np.attachNewNode(node_name)
 
         uv_sphere_np.setPos(x, y, z)
 
@@ -89,55 +137,32 @@ def run_scenario():
 
     ### define and schedule procedure to move the camera
 
-    ## preparation
-
-    # function to cycle through 2D points representing circle in xy plane
-
-    next_xy = cycle(
-        yield_2d_circle_points(cam_xy_move_radius*20, cam_xy_move_radius + 20)
-    ).__next__
-
-    # function to cycle through points forming a vertical line segment going
-    # up and down on the z axis;
-
-    lowest = -SPHERE_RADIUS * 1
-    highest = SPHERE_RADIUS * 2
-    factor = 100
-    speed = SPHERE_RADIUS * 2
+    spinCameraTask = make_spin_camera_task(
 
-    next_z = cycle(
+        base.camera,
 
-        # up
+        *get_camera_path_arrays(
+            xy_quantity=cam_xy_move_radius*20,
+            xy_radius=cam_xy_move_radius + 20,
+            lowest=-SPHERE_RADIUS * 1,
+            highest=SPHERE_RADIUS * 2,
+            speed=SPHERE_RADIUS * 2,
+        ),
 
-        tuple(
-            i/factor
-            for i in range(lowest*factor, highest*factor, speed)
-        )
+        look_at_z=SPHERE_RADIUS,
 
-        # down
-
-        + tuple(
-            i/factor
-            for i in range(highest*factor, lowest*factor, -speed)
-        )
-
-    ).__next__
-
-
-    ## defining procedure
-
-    def spinCameraTask(task):
+    )
 
-        base.camera.setPos(*next_xy(), next_z())
-        base.camera.look_at(0, 0, SPHERE_RADIUS)
+    ## if requested via the PROCGENMEMTEST_DEBUG environment variable,
+    ## print debug info (listing the whole model pool writes a lot to
+    ## stdout, which can stall the startup when measuring the scenario)
 
-        return Task.cont
+    if environ.get('PROCGENMEMTEST_DEBUG'):
 
-    ##
-    print()
-    print('children in sphere_group:', sphere_group.getNumChildren())
-    print()
-    ModelPool.list_contents()
+        print()
+        print('children in sphere_group:', sphere_group.getNumChildren())
+        print()
+        ModelPool.list_contents()
 
     ## scheduling
     base.taskMgr.add(spinCameraTask, "SpinCameraTask")
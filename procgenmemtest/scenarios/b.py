@@ -4,16 +4,17 @@ In this scenario, a Geom instance representing a UV sphere is
 procedurally generated added to multiple instances of GeomNode.
 """
 
-### standard library import
-from itertools import cycle
+### standard library imports
+
+from os import environ
+
+from itertools import repeat
 
 
 ### third-party imports
 
 from direct.showbase.ShowBase import ShowBase
 
-from direct.task import Task
-
 from direct.gui.OnscreenText import OnscreenText
 
 from panda3d.core import ModelPool, GeomNode
@@ -23,12 +24,31 @@ from panda3d.core import ModelPool, GeomNode
 
 from ..modelgen.uvspheregeom import get_uv_sphere_geom
 
-from ..points2d import yield_2d_circle_points
+from ..points2d import get_2d_circle_coordinates
+
+from .camerapath import get_camera_path_arrays, make_spin_camera_task
+
+from .quadtree import get_quadtree_parents
+
+from .spherelod import get_uv_sphere_lod_geoms, make_uv_sphere_lod_node
+
+
+
+def run_scenario(flatten=False, quadtree=False, lod=False):
+    """Generate Geom and feed it to multiple GeomNode instances.
 
+    If flatten is True, the spheres are flattened into as few Geoms as
+    possible after being placed, in order to reduce the number of draw
+    calls.
 
+    If quadtree is True, the spheres are grouped in a quadtree of nodes
+    (see scenarios/quadtree.py) rather than being attached directly to a
+    single node, so that groups of spheres out of view are culled at once.
 
-def run_scenario():
-    """Generate Geom and feed it to multiple GeomNode instances."""
+    If lod is True, each sphere is a LODNode switching between spheres with
+    fewer segments and rings the farther they are from the camera (see
+    scenarios/spherelod.py).
+    """
 
     ### define number of spheres to be instantiated in total
     NO_OF_SPHERES = 250
@@ -42,7 +62,12 @@ def run_scenario():
     ### display text describing scenario
 
     OnscreenText(
-        text="Scenario B: generated Geom shared among multiple GeomNodes",
+        text=(
+            "Scenario B: generated Geom shared among multiple GeomNodes"
+            + (" (flattened)" if flatten else "")
+            + (" (quadtree)" if quadtree else "")
+            + (" (LOD)" if lod else "")
+        ),
         pos=(0, .02),
         fg=(1.,1.,1.,1.),
         shadow=(0.,0.,0.,1.),
@@ -52,7 +77,14 @@ def run_scenario():
     ### create group wherein to attach sphere in the scene graph
     sphere_group = base.render.attachNewNode('sphere_group')
 
-    ### generate UV sphere Geom
+    ### set color and render mode once in the group, so they are inherited
+    ### by all spheres instead of being set on each of them
+
+    sphere_group.setColor(0., 0., 1., 1.)
+    sphere_group.set_render_mode_filled_wireframe((1.,1.,1.,1.))
+
+    ### generate UV sphere Geom (or, if requested, one Geom per level of
+    ### detail)
 
     SPHERE_RADIUS = 5
 
@@ -60,92 +92,120 @@ def run_scenario():
     NO_OF_SEGMENTS = 16
     NO_OF_RINGS = 8
 
-    sphere_geom = get_uv_sphere_geom(
-        radius=SPHERE_RADIUS,
-        no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
-        no_of_rings=NO_OF_RINGS * MULTIPLIER,
-        vdata_name='uv_sphere_vertices',
-    )
+    if lod:
+
+        sphere_lod_geoms = get_uv_sphere_lod_geoms(
+            radius=SPHERE_RADIUS,
+            no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
+            no_of_rings=NO_OF_RINGS * MULTIPLIER,
+            vdata_name='uv_sphere_vertices',
+        )
+
+    else:
+
+        sphere_geom = get_uv_sphere_geom(
+            radius=SPHERE_RADIUS,
+            no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
+            no_of_rings=NO_OF_RINGS * MULTIPLIER,
+            vdata_name='uv_sphere_vertices',
+        )
 
-    ### load sphere model NO_OF_SPHERES times (after the first, the subsequent
-    ### instances should all use the same geometry from the model pool)
+    ### add the UV sphere Geom to NO_OF_SPHERES GeomNode instances (the Geom
+    ### is generated only once, above, so all instances share the same
+    ### vertex data and primitives instead of each one having its own copy)
 
     cam_xy_move_radius = NO_OF_SPHERES * 3
 
+    ## calculate the coordinates of the points forming a 2D circle in the xy
+    ## plane, all at once, where the spheres will be placed
+
+    sphere_xs, sphere_ys = get_2d_circle_coordinates(
+        quantity=NO_OF_SPHERES,
+        radius=cam_xy_move_radius,
+    )
+
     ## iterate over points forming a 2D sphere in the xy plane, placing a
     ## sphere in each point
 
     z = .1
 
-    for sphere_index, (x, y) in enumerate(
-
-        yield_2d_circle_points(
-            quantity=NO_OF_SPHERES,
-            radius=cam_xy_move_radius,
-        )
-
-    ):
+    # nodes to which each sphere is attached: the sphere group itself or,
+    # if requested, the innermost quadrants of a quadtree built within it
 
-        node = GeomNode(f'node_name_{sphere_index:>03}')
-        node.addGeom(sphere_geom)
+    sphere_parents = (
+        get_quadtree_parents(sphere_group, sphere_xs, sphere_ys)
+        if quadtree
+        else repeat(sphere_group)
+    )
 
-        uv_sphere_np = sphere_group.attach_new_node(node)
+    # names of the nodes, produced by mapping the bound format method of a
+    # single template string over the sphere indices
 
-        uv_sphere_np.setPos(x, y, z)
-        uv_sphere_np.setColor(0., 0., 1., 1.)
-        uv_sphere_np.set_render_mode_filled_wireframe((1.,1.,1.,1.))
+    node_names = map('node_name_{:>03}'.format, range(NO_OF_SPHERES))
 
-    ### define and schedule procedure to move the camera
+    for node_name, x, y, parent_np in zip(
+        node_names,
+        sphere_xs,
+        sphere_ys,
+        sphere_parents,
+    ):
 
-    ## preparation
+        if lod:
 
-    # function to cycle through 2D points representing circle in xy plane
+            node = make_uv_sphere_lod_node(
+                node_name,
+                sphere_lod_geoms,
+                SPHERE_RADIUS,
+            )
 
-    next_xy = cycle(
-        yield_2d_circle_points(cam_xy_move_radius*20, cam_xy_move_radius + 20)
-    ).__next__
+        else:
 
-    # function to cycle through points forming a vertical line segment going
-    # up and down on the z axis;
+            node = GeomNode(node_name)
+            node.addGeom(sphere_geom)
 
-    lowest = -SPHERE_RADIUS * 1
-    highest = SPHERE_RADIUS * 2
-    factor = 100
-    speed = SPHERE_RADIUS * 2
+        uv_sphere_np = parent_np.attach_new_node(node)
 
-    next_z = cycle(
+        uv_sphere_np.setPos(x, y, z)
 
-        # up
+    ### if requested, flatten the spheres so they are merged into as few
+    ### Geoms as possible, which reduces the number of draw calls;
+    ###
+    ### this is opt-in because the merged Geoms are copies of the shared
+    ### Geom (each with its positions baked into the vertices), which
+    ### defeats the purpose of this scenario, that is, measuring many
+    ### GeomNodes sharing a single Geom
 
-        tuple(
-            i/factor
-            for i in range(lowest*factor, highest*factor, speed)
-        )
+    if flatten:
+        sphere_group.flattenStrong()
 
-        # down
+    ### define and schedule procedure to move the camera
 
-        + tuple(
-            i/factor
-            for i in range(highest*factor, lowest*factor, -speed)
-        )
+    spinCameraTask = make_spin_camera_task(
 
-    ).__next__
+        base.camera,
 
+        *get_camera_path_arrays(
+            xy_quantity=cam_xy_move_radius*20,
+            xy_radius=cam_xy_move_radius + 20,
+            lowest=-SPHERE_RADIUS * 1,
+            highest=SPHERE_RADIUS * 2,
+            speed=SPHERE_RADIUS * 2,
+        ),
 
-    ## defining procedure
+        look_at_z=SPHERE_RADIUS,
 
-    def spinCameraTask(task):
+    )
 
-        base.camera.setPos(*next_xy(), next_z())
-        base.camera.look_at(0, 0, SPHERE_RADIUS)
+    ## if requested via the PROCGENMEMTEST_DEBUG environment variable,
+    ## print debug info (listing the whole model pool writes a lot to
+    ## stdout, which can stall the startup when measuring the scenario)
 
-        return Task.cont
+    if environ.get('PROCGENMEMTEST_DEBUG'):
 
-    ##
-    print()
-    print('Children in sphere_group:', sphere_group.getNumChildren())
-    print()
-    ModelPool.list_contents()
+        print()
+        print('Children in sphere_group:', sphere_group.getNumChildren())
+        print()
+        ModelPool.list_contents()
 
     ## scheduling
     base.taskMgr.add(spinCameraTask, "SpinCameraTask")
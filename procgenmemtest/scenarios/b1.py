@@ -5,16 +5,17 @@ Geom (representing a UV sphere) is replicated multiple times
 via instancing.
 """
 
-### standard library import
-from itertools import cycle
+### standard library imports
+
+from os import environ
+
+from itertools import repeat
 
 
 ### third-party imports
 
 from direct.showbase.ShowBase import ShowBase
 
-from direct.task import Task
-
 from direct.gui.OnscreenText import OnscreenText
 
 from panda3d.core import ModelPool, GeomNode, NodePath
@@ -24,12 +25,27 @@ from panda3d.core import ModelPool, GeomNode, NodePath
 
 from ..modelgen.uvspheregeom import get_uv_sphere_geom
 
-from ..points2d import yield_2d_circle_points
+from ..points2d import get_2d_circle_coordinates
+
+from .camerapath import get_camera_path_arrays, make_spin_camera_task
+
+from .quadtree import get_quadtree_parents
+
+from .spherelod import get_uv_sphere_lod_geoms, make_uv_sphere_lod_node
 
 
 
-def run_scenario():
-    """Create GeomNode with generated Geom and replicate it via isntancing."""
+def run_scenario(quadtree=False, lod=False):
+    """Create GeomNode with generated Geom and replicate it via isntancing.
+
+    If quadtree is True, the spheres are grouped in a quadtree of nodes
+    (see scenarios/quadtree.py) rather than being attached directly to a
+    single node, so that groups of spheres out of view are culled at once.
+
+    If lod is True, each sphere is a LODNode switching between spheres with
+    fewer segments and rings the farther they are from the camera (see
+    scenarios/spherelod.py).
+    """
 
     ### define number of spheres to be instantiated in total
     NO_OF_SPHERES = 250
@@ -46,6 +62,8 @@ def run_scenario():
         text=(
             "Scenario B1: GeomNode with generated Geom replicated via"
             " instancing"
+            + (" (quadtree)" if quadtree else "")
+            + (" (LOD)" if lod else "")
         ),
         pos=(0, .02),
         fg=(1.,1.,1.,1.),
@@ -56,9 +74,8 @@ def run_scenario():
     ### create group wherein to attach sphere in the scene graph
     sphere_group = base.render.attachNewNode('sphere_group')
 
-    ### create GeomNode with a generated UV sphere Geom
-
-    model = GeomNode('uv_sphere')
+    ### create GeomNode with a generated UV sphere Geom (or, if requested,
+    ### a LODNode with one generated UV sphere Geom per level of detail)
 
     SPHERE_RADIUS = 5
 
@@ -66,16 +83,37 @@ def run_scenario():
     NO_OF_SEGMENTS = 16
     NO_OF_RINGS = 8
 
-    model.addGeom(
+    if lod:
+
+        model = make_uv_sphere_lod_node(
+
+            'uv_sphere',
+
+            get_uv_sphere_lod_geoms(
+                radius=SPHERE_RADIUS,
+                no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
+                no_of_rings=NO_OF_RINGS * MULTIPLIER,
+                vdata_name='uv_sphere_vertices',
+            ),
+
+            SPHERE_RADIUS,
 
-        get_uv_sphere_geom(
-            radius=SPHERE_RADIUS,
-            no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
-            no_of_rings=NO_OF_RINGS * MULTIPLIER,
-            vdata_name='uv_sphere_vertices',
         )
 
-    )
+    else:
+
+        model = GeomNode('uv_sphere')
+
+        model.addGeom(
+
+            get_uv_sphere_geom(
+                radius=SPHERE_RADIUS,
+                no_of_segments=NO_OF_SEGMENTS * MULTIPLIER,
+                no_of_rings=NO_OF_RINGS * MULTIPLIER,
+                vdata_name='uv_sphere_vertices',
+            )
+
+        )
 
     ### wrap model in a node path and set render mode
 
@@ -89,22 +127,38 @@ def run_scenario():
 
     cam_xy_move_radius = NO_OF_SPHERES * 3
 
+    # calculate the coordinates of the points forming a 2D circle in the xy
+    # plane, all at once, where the spheres will be placed
+
+    sphere_xs, sphere_ys = get_2d_circle_coordinates(
+        quantity=NO_OF_SPHERES,
+        radius=cam_xy_move_radius,
+    )
+
     z = .1
 
-    for sphere_index, (x, y) in enumerate(
+    # nodes to which each sphere is attached: the sphere group itself or,
+    # if requested, the innermost quadrants of a quadtree built within it
 
-        yield_2d_circle_points(
-            quantity=NO_OF_SPHERES,
-            radius=cam_xy_move_radius,
-        )
+    sphere_parents = (
+        get_quadtree_parents(sphere_group, sphere_xs, sphere_ys)
+        if quadtree
+        else repeat(sphere_group)
+    )
+
+    # names of the nodes, produced by mapping the bound format method of a
+    # single template string over the sphere indices
+
+    node_names = map('instancing_replica_{:>03}'.format, range(NO_OF_SPHERES))
 
+    for node_name, x, y, parent_np in zip(
+        node_names,
+        sphere_xs,
+        sphere_ys,
+        sphere_parents,
     ):
 
-        uv_sphere_np = (
-            sphere_group.attachNewNode(
-                f'instancing_replica_{sphere_index:>03}'
-            )
-        )
+        uv_sphere_np = parent_np.attachNewNode(node_name)
 
         uv_sphere_np.setPos(x, y, z)
 
@@ -112,55 +166,32 @@ def run_scenario():
 
     ### define and schedule procedure to move the camera
 
-    ## preparation
-
-    # function to cycle through 2D points representing circle in xy plane
-
-    next_xy = cycle(
-        yield_2d_circle_points(cam_xy_move_radius*20, cam_xy_move_radius + 20)
-    ).__next__
-
-    # function to cycle through points forming a vertical line segment going
-    # up and down on the z axis;
+    spinCameraTask = make_spin_camera_task(
 
-    lowest = -SPHERE_RADIUS * 1
-    highest = SPHERE_RADIUS * 2
-    factor = 100
-    speed = SPHERE_RADIUS * 2
-
-    next_z = cycle(
-
-        # up
-
-        tuple(
-            i/factor
-            for i in range(lowest*factor, highest*factor, speed)
-        )
-
-        # down
-
-        + tuple(
-            i/factor
-            for i in range(highest*factor, lowest*factor, -speed)
-        )
-
-    ).__next__
+        base.camera,
 
+        *get_camera_path_arrays(
+            xy_quantity=cam_xy_move_radius*20,
+            xy_radius=cam_xy_move_radius + 20,
+            lowest=-SPHERE_RADIUS * 1,
+            highest=SPHERE_RADIUS * 2,
+            speed=SPHERE_RADIUS * 2,
+        ),
 
-    ## defining procedure
+        look_at_z=SPHERE_RADIUS,
 
-    def spinCameraTask(task):
+    )
 
-        base.camera.setPos(*next_xy(), next_z())
-        base.camera.look_at(0, 0, SPHERE_RADIUS)
+    ## if requested via the PROCGENMEMTEST_DEBUG environment variable,
+    ## print debug info (listing the whole model pool writes a lot to
+    ## stdout, which can stall the startup when measuring the scenario)
 
-        return Task.cont
+    if environ.get('PROCGENMEMTEST_DEBUG'):
 
-    ##
-    print()
-    print('Children in sphere_group:', sphere_group.getNumChildren())
-    print()
-    ModelPool.list_contents()
+        print()
+        print('Children in sphere_group:', sphere_group.getNumChildren())
+        print()
+        ModelPool.list_contents()
 
     ## scheduling
     base.taskMgr.add(spinCameraTask, "SpinCameraTask")
@@ -0,0 +1,159 @@
+"""Facility with functions for moving the camera in the scenarios.
+
+In all scenarios, the camera goes around a circle in the xy plane while
+going up and down on the z axis, always looking at a point above the
+origin.
+"""
+
+### standard library imports
+
+from array import array
+
+from itertools import chain
+
+from math import atan2, degrees, hypot
+
+
+### third-party import
+from direct.task import Task
+
+
+### local import
+from ..points2d import get_2d_circle_coordinates
+
+
+
+def get_camera_path_arrays(
+    xy_quantity,
+    xy_radius,
+    lowest,
+    highest,
+    speed,
+    factor=100,
+):
+    """Return arrays with x, y and z coordinates of camera path.
+
+    The x and y coordinates are those of xy_quantity points forming a
+    circle of radius xy_radius in the xy plane.
+
+    The z coordinates are those of points forming a vertical line segment
+    going up and down on the z axis, between lowest and highest. The
+    integers lowest and highest are multiplied by the integer factor in
+    order to define the range of points, with speed as the step, and each
+    point is then divided by the factor.
+
+    All coordinates are stored in arrays of 32-bit floats (the precision
+    used by Panda3D for positions).
+    """
+
+    ### coordinates of 2D points representing circle in xy plane
+
+    cam_xs, cam_ys = (
+
+        array('f', coordinates)
+
+        for coordinates in get_2d_circle_coordinates(xy_quantity, xy_radius)
+
+    )
+
+    ### z coordinates of points forming a vertical line segment going up and
+    ### down on the z axis
+
+    cam_zs = array(
+
+        'f',
+
+        map(
+
+            # divide each of the integers below by the factor
+            factor.__rtruediv__,
+
+            chain(
+
+                # up
+                range(lowest*factor, highest*factor, speed),
+
+                # down
+                range(highest*factor, lowest*factor, -speed),
+
+            ),
+
+        ),
+
+    )
+
+    ### finally, return the arrays
+    return cam_xs, cam_ys, cam_zs
+
+
+def make_spin_camera_task(camera, cam_xs, cam_ys, cam_zs, look_at_z):
+    """Return task procedure moving camera along given path each frame.
+
+    The camera is placed at the point of the path corresponding to the
+    current frame (cycling through the x/y and z coordinates separately),
+    oriented so that it looks at the point (0, 0, look_at_z).
+
+    The x and y coordinates are expected to form a circle around the z
+    axis, like the ones returned by get_camera_path_arrays(), so that the
+    orientation of the camera can be precomputed (see below).
+    """
+
+    ### number of points in each path
+    no_of_xy_points = len(cam_xs)
+    no_of_z_points = len(cam_zs)
+
+    ### precompute the orientation of the camera for each point, rather
+    ### than calculating it in every frame with NodePath.look_at();
+    ###
+    ### since the camera goes around the z axis, its distance to the axis is
+    ### the same in all points of the path, so its heading only depends on
+    ### its x and y coordinates and its pitch only depends on its z
+    ### coordinate; because of that, the headings and pitches can be stored
+    ### in separate arrays, indexed just like the coordinates they depend on
+
+    # headings, that make the camera face the z axis
+
+    cam_hs = array(
+        'f',
+        [degrees(atan2(x, -y)) for x, y in zip(cam_xs, cam_ys)],
+    )
+
+    # pitches, that make the camera tilt towards the point looked at
+
+    distance_to_axis = hypot(cam_xs[0], cam_ys[0])
+
+    cam_ps = array(
+        'f',
+        [degrees(atan2(look_at_z - z, distance_to_axis)) for z in cam_zs],
+    )
+
+    ### camera method and task status used in every frame, referenced
+    ### beforehand so they aren't looked up again each time the procedure
+    ### runs
+
+    set_camera_pos_hpr = camera.setPosHpr
+
+    task_cont = Task.cont
+
+    ### define and return procedure
+
+    def spinCameraTask(task):
+
+        ## pick the points of the paths corresponding to the current frame,
+        ## cycling through them
+
+        xy_index = task.frame % no_of_xy_points
+        z_index = task.frame % no_of_z_points
+
+        set_camera_pos_hpr(
+            cam_xs[xy_index],
+            cam_ys[xy_index],
+            cam_zs[z_index],
+            cam_hs[xy_index],
+            cam_ps[z_index],
+            0,
+        )
+
+        return task_cont
+
+    return spinCameraTask
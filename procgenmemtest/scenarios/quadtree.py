@@ -0,0 +1,101 @@
+"""Facility with function for grouping scene nodes in a quadtree.
+
+Used by scenarios in which many spheres are placed in the xy plane, so
+that, rather than being direct children of a single node, the spheres can
+be grouped under a hierarchy of nodes, each one grouping the spheres in a
+quadrant of its parent. This way, whenever a group is out of view, the
+cull traversal can skip all spheres in it at once.
+"""
+
+### third-party import
+from panda3d.core import BoundingVolume
+
+
+
+def get_quadtree_parents(root_np, xs, ys, max_points_per_leaf=16):
+    """Create quadtree of nodes for given points, returning their parents.
+
+    The points, whose x and y coordinates are given, are recursively split
+    into quadrants (first in halves along the median x coordinate, then
+    each half along its median y coordinate) until each quadrant has no
+    more than max_points_per_leaf points. A node is created under root_np
+    for each quadrant, nested just like the quadrants themselves.
+
+    Returns a list with the node path of the innermost quadrant of each
+    point, in the same order as the points, so that the node of each point
+    can be attached to it.
+    """
+
+    ### check error conditions
+
+    if len(xs) != len(ys):
+
+        raise ValueError(
+            "xs and ys must have the same length, not"
+            f" {len(xs)} and {len(ys)}"
+        )
+
+    if max_points_per_leaf < 1:
+
+        raise ValueError(
+            f"max_points_per_leaf must be >= 1, not {max_points_per_leaf}"
+        )
+
+    ### create list to hold the parent of each point
+    parents = [root_np] * len(xs)
+
+    ### define function to split points (represented by their indices)
+    ### recursively into quadrants, creating the respective nodes
+
+    def subdivide(group_np, point_indices):
+
+        ## if there aren't too many points in this group, just store the
+        ## group as the parent of each of them
+
+        if len(point_indices) <= max_points_per_leaf:
+
+            for point_index in point_indices:
+                parents[point_index] = group_np
+
+            return
+
+        ## otherwise, split the points into halves along their median x
+        ## coordinate, then each half along its median y coordinate,
+        ## creating a node for each resulting quadrant and subdividing it
+        ## in turn
+
+        group_name = group_np.getName()
+
+        sorted_by_x = sorted(point_indices, key=xs.__getitem__)
+        middle = len(sorted_by_x) // 2
+
+        quadrant_index = 0
+
+        for half in (sorted_by_x[:middle], sorted_by_x[middle:]):
+
+            sorted_by_y = sorted(half, key=ys.__getitem__)
+            middle_of_half = len(sorted_by_y) // 2
+
+            for quadrant in (
+                sorted_by_y[:middle_of_half],
+                sorted_by_y[middle_of_half:],
+            ):
+
+                quadrant_np = group_np.attachNewNode(
+                    f'{group_name}_quadrant_{quadrant_index}'
+                )
+
+                # boxes fit the spheres of a quadrant more tightly than
+                # the default bounding spheres
+
+                quadrant_np.node().setBoundsType(BoundingVolume.BT_box)
+
+                subdivide(quadrant_np, quadrant)
+
+                quadrant_index += 1
+
+    ### subdivide all points, starting from the root
+    subdivide(root_np, range(len(xs)))
+
+    ### finally, return the parents
+    return parents
@@ -0,0 +1,79 @@
+"""Facility with functions for UV spheres with levels of detail (LOD).
+
+Used by scenarios in which generated spheres can optionally be replaced
+by a LODNode switching between spheres with fewer segments and rings the
+farther they are from the camera.
+"""
+
+### third-party import
+from panda3d.core import GeomNode, LODNode, Point3
+
+
+### local import
+from ..modelgen.uvspheregeom import get_uv_sphere_geom
+
+
+
+### divisors applied to the number of segments and rings of the sphere in
+### each level of detail, from the nearest level to the farthest one
+LOD_DIVISORS = (1, 4, 16)
+
+### distances from the camera where each level of detail starts/ends, from
+### the nearest level to the farthest one (the last distance is just large
+### enough to include the farthest spheres in the scenarios)
+LOD_DISTANCES = (0, 100, 400, 10000)
+
+
+def get_uv_sphere_lod_geoms(radius, no_of_segments, no_of_rings, vdata_name):
+    """Return list of UV sphere Geoms, one per level of detail.
+
+    The number of segments and rings of each Geom is divided by the
+    respective divisor in LOD_DIVISORS (but never less than 3).
+    """
+
+    return [
+
+        get_uv_sphere_geom(
+            radius=radius,
+            no_of_segments=max(3, no_of_segments // divisor),
+            no_of_rings=max(3, no_of_rings // divisor),
+            vdata_name=f'{vdata_name}_lod_{level}',
+        )
+
+        for level, divisor in enumerate(LOD_DIVISORS)
+
+    ]
+
+
+def make_uv_sphere_lod_node(name, lod_geoms, radius):
+    """Return LODNode switching between given UV sphere Geoms.
+
+    The Geoms are expected to be the ones returned by
+    get_uv_sphere_lod_geoms(), that is, from the most detailed to the least
+    detailed one. Each of them is added to its own GeomNode, which becomes
+    a child of the LODNode. The distances are measured from the center of
+    the sphere, whose bottom sits at the origin.
+    """
+
+    ### create LODNode and set the center of the sphere as the point from
+    ### which the distances to the camera are measured
+
+    lod_node = LODNode(name)
+    lod_node.setCenter(Point3(0, 0, radius))
+
+    ### add a child and a switch for each level of detail
+
+    for level, (geom, near, far) in enumerate(
+
+        zip(lod_geoms, LOD_DISTANCES, LOD_DISTANCES[1:])
+
+    ):
+
+        geom_node = GeomNode(f'{name}_lod_{level}')
+        geom_node.addGeom(geom)
+
+        lod_node.addChild(geom_node)
+        lod_node.addSwitch(far, near)
+
+    ### finally, return the LODNode
+    return lod_node
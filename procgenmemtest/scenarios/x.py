@@ -11,8 +11,6 @@ sphere, for comparison.
 
 ### standard library imports
 
-from itertools import cycle
-
 from pathlib import Path
 
 from math import ceil
@@ -22,8 +20,6 @@ from math import ceil
 
 from direct.showbase.ShowBase import ShowBase
 
-from direct.task import Task
-
 from direct.gui.OnscreenText import OnscreenText
 
 from panda3d.core import GeomNode, Filename
@@ -33,8 +29,9 @@ from panda3d.core import GeomNode, Filename
 
 from ..modelgen.uvspheregeom import get_uv_sphere_geom
 from ..modelgen.uvsphereegg import get_uv_sphere_egg_data
+from ..modelgen.uvspherearrays import get_quantization_scale
 
-from ..points2d import yield_2d_circle_points
+from .camerapath import get_camera_path_arrays, make_spin_camera_task
 
 
 
@@ -43,6 +40,7 @@ def run_scenario(
     no_of_segments=16,
     no_of_rings=8,
     filename='',
+    quantize=False,
 ):
     """Generate sphere w/ arguments provided by user (or default values)."""
 
@@ -66,6 +64,7 @@ def run_scenario(
         (
             f"radius={radius} segments={no_of_segments} rings={no_of_rings};"
             f" vertices={no_of_vertices} tris={no_of_tris}"
+            + (" (quantized)" if quantize else "")
         ),
     ]
 
@@ -74,20 +73,23 @@ def run_scenario(
         treated_filename = str(Path(filename).with_suffix('.egg'))
         text_lines.append(f"filename={treated_filename}")
 
-    x = 0
-
-    for i, line_text in enumerate(reversed(text_lines)):
-        
-        y = .02 + i*.07
-        #y = ((i+1) *.02) + (i*.02)
-
-        OnscreenText(
-            text=line_text,
-            pos=(x, y),
-            fg=(1.,1.,1.,1.),
-            shadow=(0.,0.,0.,1.),
-            parent=base.a2dBottomCenter,
-        )
+        ## create the Panda3D filename used to save the egg file only once,
+        ## from the treated filename (which uses the conventions of the
+        ## operating system)
+        egg_filename = Filename.fromOsSpecific(treated_filename)
+
+    ## display all lines in a single text node (each new line is placed
+    ## one line height, that is, .07 units, below the previous one), whose
+    ## first line is raised so that the last one sits at the same height
+    ## as the texts of the other scenarios
+
+    OnscreenText(
+        text='\n'.join(text_lines),
+        pos=(0, .02 + ((len(text_lines) - 1) * .07)),
+        fg=(1.,1.,1.,1.),
+        shadow=(0.,0.,0.,1.),
+        parent=base.a2dBottomCenter,
+    )
 
     ### generate main sphere
 
@@ -101,6 +103,7 @@ def run_scenario(
             no_of_segments = no_of_segments,
             no_of_rings = no_of_rings,
             vdata_name='uv_sphere',
+            quantize = quantize,
 
         )
 
@@ -108,6 +111,9 @@ def run_scenario(
 
     uv_sphere_np = base.render.attachNewNode(uv_sphere_node)
 
+    if quantize:
+        uv_sphere_np.setScale(get_quantization_scale(radius))
+
     uv_sphere_np.setPos(0, 0, .001)
     uv_sphere_np.setColor(0., 0., 1., 1.)
     uv_sphere_np.set_render_mode_filled_wireframe((1.,1.,1.,1.))
@@ -118,62 +124,43 @@ def run_scenario(
 
     if filename:
 
-        get_uv_sphere_egg_data(
+        egg_written = get_uv_sphere_egg_data(
 
             radius = radius,
             no_of_segments = no_of_segments,
             no_of_rings = no_of_rings,
             vpool_name='uv_sphere',
 
-        ).writeEgg(Filename(treated_filename))
-
-    ###
+        ).writeEgg(egg_filename)
 
+        ## writeEgg() doesn't raise an error when it fails, it just returns
+        ## False, so we let the user know about it
 
-    ### define and schedule procedure to move the camera
+        if not egg_written:
+            print(f"Couldn't save egg file to {treated_filename}")
 
-    ## preparation
+    ###
 
-    # function to cycle through 2d points representing circle in x and y axes
-    next_xy = cycle(yield_2d_circle_points(360, radius * 4)).__next__
 
-    # function to cycle through points forming a vertical line segment going
-    # up and down
+    ### define and schedule procedure to move the camera
 
     int_radius = ceil(radius)
 
-    lowest = -int_radius * 2
-    highest = int_radius * 4
-    factor = 100
-    speed = int_radius * 4
+    spinCameraTask = make_spin_camera_task(
 
-    next_z = cycle(
+        base.camera,
 
-        # up
-
-        tuple(
-            i/factor
-            for i in range(lowest*factor, highest*factor, speed)
-        )
-
-        # down
-
-        + tuple(
-            i/factor
-            for i in range(highest*factor, lowest*factor, -speed)
-        )
-
-    ).__next__
-
-
-    ## defining procedure
-
-    def spinCameraTask(task):
+        *get_camera_path_arrays(
+            xy_quantity=360,
+            xy_radius=radius * 4,
+            lowest=-int_radius * 2,
+            highest=int_radius * 4,
+            speed=int_radius * 4,
+        ),
 
-        base.camera.setPos(*next_xy(), next_z())
-        base.camera.look_at(0, 0, radius)
+        look_at_z=radius,
 
-        return Task.cont
+    )
 
 
     ## white sphere of radius 1 for comparison
@@ -0,0 +1,50 @@
+"""Facility with function to get the filename of the UV sphere model.
+
+The UV sphere model used in scenarios A and A1 is stored as an Egg file,
+a text format which must be parsed when loaded. Because of that, the model
+is converted once into an equivalent Bam file (Panda3D's binary format),
+which is stored next to the Egg file and loaded instead.
+"""
+
+### standard library import
+from pathlib import Path
+
+
+### third-party import
+from panda3d.core import Filename
+
+
+
+EGG_PATH = Path(__file__).parent / 'uv_sphere.egg'
+BAM_PATH = EGG_PATH.with_suffix('.bam')
+
+
+def get_uv_sphere_model_filename(loader):
+    """Return filename of UV sphere model, writing Bam file if needed.
+
+    The Bam file is (re)written whenever it doesn't exist or is older than
+    the Egg file. If it can't be written (for instance, because the package
+    is in a read-only location), the filename of the Egg file is returned
+    instead.
+    """
+
+    egg_filename = Filename.fromOsSpecific(str(EGG_PATH))
+    bam_filename = Filename.fromOsSpecific(str(BAM_PATH))
+
+    ### if the Bam file is missing or outdated, load the Egg file (without
+    ### keeping it in the model pool) and write its contents as a Bam file
+
+    if (
+        not BAM_PATH.exists()
+        or BAM_PATH.stat().st_mtime < EGG_PATH.stat().st_mtime
+    ):
+
+        model_np = loader.loadModel(egg_filename, noCache=True)
+        bam_written = model_np.writeBamFile(bam_filename)
+        model_np.removeNode()
+
+        if not bam_written:
+            return egg_filename
+
+    ### return Bam file's filename
+    return bam_filename